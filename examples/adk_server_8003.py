@@ -5,8 +5,6 @@
   You can override with WEB_ASSETS_DIR env var to point at an Angular dist.
 """
 
-import os
-from pathlib import Path
 import uvicorn
 
 from google_adk_extras.enhanced_fast_api import get_enhanced_fast_api_app
@@ -5,7 +5,7 @@ programmatic agent loader. It is intended only to inspect the OpenAPI schema
 and enumerate endpoints exposed by the ADK web server.
 """
 
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
@@ -5,7 +5,8 @@ with support for custom credential services and enhanced configuration options.
 """
 
 import logging
-from typing import Any, Dict, List, Mapping, Optional, Union, Callable
+import os
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from starlette.types import Lifespan
 
 from fastapi import FastAPI
@@ -22,10 +23,19 @@ from google.adk.auth.credential_service.base_credential_service import BaseCrede
 from google.adk.cli.utils.agent_loader import AgentLoader
 from google.adk.cli.utils.base_agent_loader import BaseAgentLoader
 
-from .custom_agent_loader import CustomAgentLoader
+from .custom_agent_loader import CustomAgentLoader, validate_agent_registration
 
 logger = logging.getLogger(__name__)
 
+# URI schemes handled by the SQLAlchemy-backed extras services.
+_SQL_SCHEMES = frozenset({"sqlite", "postgresql", "mysql"})
+
+
+def _split_service_uri(uri: str) -> Tuple[str, str]:
+    """Split ``scheme://rest`` once; the scheme is empty if ``://`` is absent."""
+    scheme, sep, rest = uri.partition("://")
+    return (scheme, rest) if sep else ("", uri)
+
 
 class AdkBuilder:
     """Builder for creating enhanced Google ADK applications with custom credential services.
@@ -54,6 +64,38 @@ class AdkBuilder:
         ```
     """
     
+    # Fixed attribute set: no per-instance __dict__, and typos in setters fail loudly.
+    __slots__ = (
+        "_agents_dir",
+        "_app_name",
+        "_session_service_uri",
+        "_artifact_service_uri",
+        "_memory_service_uri",
+        "_eval_storage_uri",
+        "_session_service",
+        "_artifact_service",
+        "_memory_service",
+        "_credential_service",
+        "_agent_loader",
+        "_registered_agents",
+        "_session_db_kwargs",
+        "_allow_origins",
+        "_web_ui",
+        "_a2a",
+        "_a2a_expose_programmatic",
+        "_a2a_programmatic_mount_base",
+        "_a2a_card_factory",
+        "_host",
+        "_port",
+        "_trace_to_cloud",
+        "_reload_agents",
+        "_lifespan",
+        "_pending_remote_a2a",
+        "_service_cache",
+        "_share_in_memory_services",
+        "__weakref__",
+    )
+    
     def __init__(self):
         """Initialize the AdkBuilder with default configuration."""
         # Core configuration
@@ -97,17 +139,25 @@ class AdkBuilder:
         # Staging list for remote A2A agents to register (if import is deferred)
         self._pending_remote_a2a: List[Dict[str, str]] = []
 
+        # Constructed services per kind, keyed by the URI they were built from
+        self._service_cache: Dict[str, Tuple[Optional[str], Any]] = {}
+        # Opt-in: reuse one in-memory fallback per kind across builds
+        self._share_in_memory_services: bool = False
+
     # Core configuration methods
     def with_agents_dir(self, agents_dir: str) -> "AdkBuilder":
         """Set the directory containing agent definitions.
         
+        The path is expanded and made absolute once here, so later builds do
+        not depend on the working directory at build time.
+        
         Args:
             agents_dir: Path to directory containing agent subdirectories.
             
         Returns:
             AdkBuilder: Self for method chaining.
         """
-        self._agents_dir = agents_dir
+        self._agents_dir = os.path.abspath(os.path.expanduser(agents_dir)) if agents_dir else agents_dir
         return self
 
     def with_app_name(self, app_name: str) -> "AdkBuilder":
@@ -242,6 +292,23 @@ class AdkBuilder:
         self._credential_service = service
         return self
 
+    def with_shared_in_memory_services(self, enabled: bool = True) -> "AdkBuilder":
+        """Share in-memory fallback services across runners built by this builder.
+        
+        By default every ``build_runner()`` call gets fresh in-memory session,
+        artifact and memory services when no URI or instance is configured.
+        When enabled, those fallbacks are created once and shared, so state
+        written through one runner is visible to the others.
+        
+        Args:
+            enabled: Whether to share the in-memory fallback services.
+            
+        Returns:
+            AdkBuilder: Self for method chaining.
+        """
+        self._share_in_memory_services = enabled
+        return self
+
     # Web/FastAPI configuration methods
     def with_web_ui(self, enabled: bool = True) -> "AdkBuilder":
         """Enable or disable the web development UI.
@@ -433,12 +500,7 @@ class AdkBuilder:
                    .build_fastapi_app())
             ```
         """
-        if not name or not name.strip():
-            raise ValueError("Agent name cannot be empty")
-            
-        if not isinstance(agent, BaseAgent):
-            raise ValueError(f"Agent must be BaseAgent instance, got {type(agent)}")
-        
+        validate_agent_registration(name, agent)
         self._registered_agents[name] = agent
         logger.info("Registered agent instance: %s", name)
         return self
@@ -467,8 +529,12 @@ class AdkBuilder:
         if not isinstance(agents_dict, dict):
             raise ValueError("Agents must be a dictionary mapping names to BaseAgent instances")
         
+        # Validate every entry first so a bad entry registers nothing.
         for name, agent in agents_dict.items():
-            self.with_agent_instance(name, agent)
+            validate_agent_registration(name, agent)
+        
+        self._registered_agents.update(agents_dict)
+        logger.info("Registered %d agent instances", len(agents_dict))
         return self
     
     def with_agent_loader(self, loader: BaseAgentLoader) -> "AdkBuilder":
@@ -506,24 +572,28 @@ class AdkBuilder:
         if self._session_service is not None:
             return self._session_service
 
-        if self._session_service_uri:
-            db_kwargs = self._session_db_kwargs or {}
-            
-            if self._session_service_uri.startswith("yaml://"):
+        # session_db_kwargs only reach the app factory's DatabaseSessionService,
+        # so the URI alone identifies the builder's session service.
+        return self._cached_service("session", self._session_service_uri, self._build_session_service)
+
+    def _build_session_service(self, uri: Optional[str]) -> BaseSessionService:
+        """Construct a session service for ``uri`` (in-memory when unset)."""
+        if uri:
+            scheme, rest = _split_service_uri(uri)
+            if scheme == "yaml":
                 from .sessions.yaml_file_session_service import YamlFileSessionService
-                base_directory = self._session_service_uri.split("://")[1]
-                return YamlFileSessionService(base_directory=base_directory)
-            elif self._session_service_uri.startswith("redis://"):
+                return YamlFileSessionService(base_directory=rest)
+            elif scheme == "redis":
                 from .sessions.redis_session_service import RedisSessionService
-                return RedisSessionService(connection_string=self._session_service_uri)
-            elif self._session_service_uri.startswith("mongodb://"):
+                return RedisSessionService(connection_string=uri)
+            elif scheme == "mongodb":
                 from .sessions.mongo_session_service import MongoSessionService
-                return MongoSessionService(connection_string=self._session_service_uri)
-            elif self._session_service_uri.startswith(("sqlite://", "postgresql://", "mysql://")):
+                return MongoSessionService(connection_string=uri)
+            elif scheme in _SQL_SCHEMES:
                 from .sessions.sql_session_service import SQLSessionService
-                return SQLSessionService(database_url=self._session_service_uri)
+                return SQLSessionService(database_url=uri)
             else:
-                raise ValueError(f"Unsupported session service URI format: {self._session_service_uri}")
+                raise ValueError(f"Unsupported session service URI format: {uri}")
         
         return InMemorySessionService()
 
@@ -532,23 +602,26 @@ class AdkBuilder:
         if self._artifact_service is not None:
             return self._artifact_service
 
-        if self._artifact_service_uri:
-            if self._artifact_service_uri.startswith("local://"):
+        return self._cached_service("artifact", self._artifact_service_uri, self._build_artifact_service)
+
+    def _build_artifact_service(self, uri: Optional[str]) -> BaseArtifactService:
+        """Construct an artifact service for ``uri`` (in-memory when unset)."""
+        if uri:
+            scheme, rest = _split_service_uri(uri)
+            if scheme == "local":
                 from .artifacts.local_folder_artifact_service import LocalFolderArtifactService  
-                base_directory = self._artifact_service_uri.split("://")[1]
-                return LocalFolderArtifactService(base_directory=base_directory)
-            elif self._artifact_service_uri.startswith("s3://"):
+                return LocalFolderArtifactService(base_directory=rest)
+            elif scheme == "s3":
                 from .artifacts.s3_artifact_service import S3ArtifactService
-                bucket_name = self._artifact_service_uri.split("://")[1]
-                return S3ArtifactService(bucket_name=bucket_name)
-            elif self._artifact_service_uri.startswith(("sqlite://", "postgresql://", "mysql://")):
+                return S3ArtifactService(bucket_name=rest)
+            elif scheme in _SQL_SCHEMES:
                 from .artifacts.sql_artifact_service import SQLArtifactService
-                return SQLArtifactService(database_url=self._artifact_service_uri)
-            elif self._artifact_service_uri.startswith("mongodb://"):
+                return SQLArtifactService(database_url=uri)
+            elif scheme == "mongodb":
                 from .artifacts.mongo_artifact_service import MongoArtifactService
-                return MongoArtifactService(connection_string=self._artifact_service_uri)
+                return MongoArtifactService(connection_string=uri)
             else:
-                raise ValueError(f"Unsupported artifact service URI: {self._artifact_service_uri}")
+                raise ValueError(f"Unsupported artifact service URI: {uri}")
         
         return InMemoryArtifactService()
 
@@ -557,25 +630,40 @@ class AdkBuilder:
         if self._memory_service is not None:
             return self._memory_service
 
-        if self._memory_service_uri:
-            if self._memory_service_uri.startswith("yaml://"):
+        return self._cached_service("memory", self._memory_service_uri, self._build_memory_service)
+
+    def _build_memory_service(self, uri: Optional[str]) -> BaseMemoryService:
+        """Construct a memory service for ``uri`` (in-memory when unset)."""
+        if uri:
+            scheme, rest = _split_service_uri(uri)
+            if scheme == "yaml":
                 from .memory.yaml_file_memory_service import YamlFileMemoryService
-                base_directory = self._memory_service_uri.split("://")[1]
-                return YamlFileMemoryService(base_directory=base_directory)
-            elif self._memory_service_uri.startswith("redis://"):
+                return YamlFileMemoryService(base_directory=rest)
+            elif scheme == "redis":
                 from .memory.redis_memory_service import RedisMemoryService
-                return RedisMemoryService(connection_string=self._memory_service_uri)
-            elif self._memory_service_uri.startswith(("sqlite://", "postgresql://", "mysql://")):
+                return RedisMemoryService(connection_string=uri)
+            elif scheme in _SQL_SCHEMES:
                 from .memory.sql_memory_service import SQLMemoryService
-                return SQLMemoryService(database_url=self._memory_service_uri)
-            elif self._memory_service_uri.startswith("mongodb://"):
+                return SQLMemoryService(database_url=uri)
+            elif scheme == "mongodb":
                 from .memory.mongo_memory_service import MongoMemoryService
-                return MongoMemoryService(connection_string=self._memory_service_uri)
+                return MongoMemoryService(connection_string=uri)
             else:
-                raise ValueError(f"Unsupported memory service URI: {self._memory_service_uri}")
+                raise ValueError(f"Unsupported memory service URI: {uri}")
         
         return InMemoryMemoryService()
 
+    def _cached_service(self, kind: str, uri: Optional[str], factory: Callable[[Optional[str]], Any]) -> Any:
+        """Return the service for ``kind``, reused while ``uri`` is unchanged."""
+        if not uri and not self._share_in_memory_services:
+            return factory(uri)
+        cached = self._service_cache.get(kind)
+        if cached is not None and cached[0] == uri:
+            return cached[1]
+        service = factory(uri)
+        self._service_cache[kind] = (uri, service)
+        return service
+
     def _create_credential_service(self) -> Optional[BaseCredentialService]:
         """Return explicitly provided ADK credential service instance (optional)."""
         return self._credential_service
@@ -595,8 +683,7 @@ class AdkBuilder:
             if self._registered_agents:
                 if isinstance(self._agent_loader, CustomAgentLoader):
                     # Register agents into the existing CustomAgentLoader
-                    for name, agent in self._registered_agents.items():
-                        self._agent_loader.register_agent(name, agent)
+                    self._agent_loader.register_agents(self._registered_agents)
                     logger.info("Registered %d agents into existing CustomAgentLoader", 
                               len(self._registered_agents))
                 else:
@@ -616,8 +703,7 @@ class AdkBuilder:
             custom_loader = CustomAgentLoader()
             
             # Register all agents
-            for name, agent in self._registered_agents.items():
-                custom_loader.register_agent(name, agent)
+            custom_loader.register_agents(self._registered_agents)
             
             logger.info("Registered %d agents into CustomAgentLoader", len(self._registered_agents))
             return custom_loader
@@ -659,11 +745,17 @@ class AdkBuilder:
         """
         # Create services (agent loader validates agent configuration)
         agent_loader = self._create_agent_loader()
-        session_service = self._create_session_service()
-        artifact_service = self._create_artifact_service()
-        memory_service = self._create_memory_service()
         credential_service = self._create_credential_service()
         
+        # The app factory builds its own services from the URIs passed below;
+        # construct URI-configured ones here, uncached, only to reject bad URIs.
+        if self._session_service is None and self._session_service_uri:
+            self._build_session_service(self._session_service_uri)
+        if self._artifact_service is None and self._artifact_service_uri:
+            self._build_artifact_service(self._artifact_service_uri)
+        if self._memory_service is None and self._memory_service_uri:
+            self._build_memory_service(self._memory_service_uri)
+        
         # No custom credential initialization; ADK services are passed through
         
         # Use our enhanced FastAPI function that properly supports credential services
@@ -700,6 +792,10 @@ class AdkBuilder:
     def build_runner(self, agent_or_agent_name: Union[BaseAgent, str]) -> Runner:
         """Build and return configured Runner.
         
+        Runners built from the same builder reuse its URI-configured services.
+        In-memory fallbacks are fresh per runner unless
+        ``with_shared_in_memory_services()`` is enabled.
+        
         Args:
             agent_or_agent_name: Agent instance or agent name to load.
             
@@ -4,11 +4,14 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
 import base64
+import hashlib
+import hmac
+import secrets
 from fastapi.security import APIKeyHeader
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .config import AuthConfig, JwtIssuerConfig, JwtValidatorConfig
-from .jwt_utils import decode_jwt, encode_jwt, now_ts
+from .jwt_utils import JWTError, decode_jwt, encode_jwt, now_ts
 from typing import Any
 
 
@@ -23,8 +26,16 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
 
     validator = cfg.jwt_validator
     issuer_cfg = cfg.jwt_issuer
-    api_keys = set(cfg.api_keys or [])
-    basic_users = cfg.basic_users or {}
+    # Static secrets are held as keyed BLAKE2b digests computed once here, so
+    # each request costs one short digest and a fixed-length compare.
+    mac_key = secrets.token_bytes(32)
+
+    def _mac(value: str) -> bytes:
+        return hashlib.blake2b(value.encode("utf-8"), key=mac_key, digest_size=32).digest()
+
+    api_keys = {_mac(k) for k in (cfg.api_keys or [])}
+    # Users with an empty password can never authenticate, as before.
+    basic_users = {u: _mac(p) for u, p in (cfg.basic_users or {}).items() if p}
     auth_store: Optional[Any] = None
     if issuer_cfg and issuer_cfg.database_url:
         url = issuer_cfg.database_url
@@ -66,7 +77,7 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
                 api_key = request.headers.get("x-api-key") or request.headers.get("X-API-Key")
             if not api_key:
                 api_key = await api_key_header.__call__(request)
-            if api_key and api_key in api_keys:
+            if api_key and _mac(api_key) in api_keys:
                 return {"method": "api_key", "sub": "api_key_client"}
             if api_key and auth_store and auth_store.verify_api_key(api_key):
                 return {"method": "api_key", "sub": "api_key_client"}
@@ -78,7 +89,7 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
                 b64 = authz.split(" ", 1)[1]
                 raw = base64.b64decode(b64).decode("utf-8")
                 username, _, password = raw.partition(":")
-            except Exception:
+            except ValueError:  # binascii.Error / UnicodeDecodeError
                 username, password = "", ""
             # If SQL store present, try it first; else fall back to configured map
             if auth_store:
@@ -86,7 +97,7 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
                 if uid:
                     return {"method": "basic", "sub": uid, "username": username}
             stored = basic_users.get(username)
-            if stored and (stored == password):
+            if stored and hmac.compare_digest(stored, _mac(password)):
                 return {"method": "basic", "sub": username, "username": username}
 
         # Bearer JWT
@@ -101,12 +112,12 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
                         jwks_url=validator.jwks_url,
                         hs256_secret=validator.hs256_secret,
                     )
-                    sub = str(claims.get("sub"))
-                    if not sub:
-                        raise HTTPException(status_code=401, detail="Invalid token: no subject")
-                    return {"method": "jwt", "sub": sub, "claims": claims}
-                except Exception as e:
+                except JWTError as e:
                     raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
+                sub = claims.get("sub")
+                if not sub:
+                    raise HTTPException(status_code=401, detail="Invalid token: no subject")
+                return {"method": "jwt", "sub": str(sub), "claims": claims}
 
         raise HTTPException(status_code=401, detail="Unauthorized")
 
@@ -180,6 +191,20 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
         if issuer_cfg.algorithm == "HS256" and not issuer_cfg.hs256_secret:
             raise RuntimeError("HS256 issuer requires hs256_secret")
         router = APIRouter()
+        # Signing inputs that do not vary per token, resolved once.
+        signing_key = issuer_cfg.hs256_secret if issuer_cfg.algorithm == "HS256" else ""
+        static_claims = {"iss": issuer_cfg.issuer, "aud": issuer_cfg.audience}
+
+        def _issue_access(sub: str) -> str:
+            now = now_ts()
+            access = {
+                **static_claims,
+                "sub": sub,
+                "iat": now,
+                "nbf": now,
+                "exp": now + issuer_cfg.access_ttl_seconds,
+            }
+            return encode_jwt(access, algorithm=issuer_cfg.algorithm, key=signing_key)
 
         @router.post("/auth/register")
         async def register(username: str, password: str):
@@ -207,17 +232,7 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
             else:
                 raise HTTPException(status_code=400, detail="unsupported_grant_type")
 
-            now = now_ts()
-            access = {
-                "iss": issuer_cfg.issuer,
-                "aud": issuer_cfg.audience,
-                "sub": sub,
-                "iat": now,
-                "nbf": now,
-                "exp": now + issuer_cfg.access_ttl_seconds,
-            }
-            key = issuer_cfg.hs256_secret if issuer_cfg.algorithm == "HS256" else ""
-            access_token = encode_jwt(access, algorithm=issuer_cfg.algorithm, key=key)
+            access_token = _issue_access(sub)
 
             refresh_token = None
             if auth_store:
@@ -231,17 +246,7 @@ def attach_auth(app: FastAPI, cfg: Optional[AuthConfig]) -> None:
                 raise HTTPException(status_code=400, detail="invalid_request")
             if not auth_store.verify_refresh(refresh_token, user_id, fingerprint=fingerprint):
                 raise HTTPException(status_code=401, detail="invalid_grant")
-            now = now_ts()
-            access = {
-                "iss": issuer_cfg.issuer,
-                "aud": issuer_cfg.audience,
-                "sub": user_id,
-                "iat": now,
-                "nbf": now,
-                "exp": now + issuer_cfg.access_ttl_seconds,
-            }
-            key = issuer_cfg.hs256_secret if issuer_cfg.algorithm == "HS256" else ""
-            access_token = encode_jwt(access, algorithm=issuer_cfg.algorithm, key=key)
+            access_token = _issue_access(user_id)
             return {"access_token": access_token, "token_type": "bearer"}
 
         app.include_router(router)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-import base64
-import json
+import functools
 import time
 from typing import Any, Dict, Optional
 
-# Lazy import PyJWT to keep this optional when auth is not used.
+
+class JWTError(Exception):
+    """Raised by decode_jwt when a token cannot be validated.
+
+    Wraps PyJWT's own errors, and a missing PyJWT install, so callers can
+    reject the token without importing PyJWT themselves.
+    """
+
+
+# Lazy import PyJWT to keep this optional when auth is not used. Cached so
+# the per-request encode/decode path skips the import machinery.
+@functools.lru_cache(maxsize=None)
 def _import_pyjwt():
     try:
         import jwt  # type: ignore
@@ -17,8 +27,11 @@ def _import_pyjwt():
         ) from e
 
 
-def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+@functools.lru_cache(maxsize=32)
+def _jwk_client(jwks_url: str):
+    # One client per JWKS URL so its fetched key set is reused across requests.
+    _jwt, PyJWKClient = _import_pyjwt()
+    return PyJWKClient(jwks_url)
 
 
 def encode_jwt(payload: Dict[str, Any], *, algorithm: str, key: str, headers: Optional[Dict[str, Any]] = None) -> str:
@@ -28,16 +41,20 @@ def encode_jwt(payload: Dict[str, Any], *, algorithm: str, key: str, headers: Op
 
 def decode_jwt(token: str, *, issuer: Optional[str] = None, audience: Optional[str] = None,
                jwks_url: Optional[str] = None, hs256_secret: Optional[str] = None) -> Dict[str, Any]:
-    jwt, PyJWKClient = _import_pyjwt()
+    if not (jwks_url or hs256_secret):
+        raise ValueError("No validation method configured (jwks_url or hs256_secret required)")
+    try:
+        jwt, _PyJWKClient = _import_pyjwt()
+    except ImportError as e:
+        raise JWTError(str(e)) from e
     options = {"verify_signature": True, "verify_exp": True, "verify_nbf": True}
-    if jwks_url:
-        jwk_client = PyJWKClient(jwks_url)
-        signing_key = jwk_client.get_signing_key_from_jwt(token).key
-        return jwt.decode(token, signing_key, algorithms=["RS256", "ES256"], audience=audience, issuer=issuer, options=options)
-    elif hs256_secret:
+    try:
+        if jwks_url:
+            signing_key = _jwk_client(jwks_url).get_signing_key_from_jwt(token).key
+            return jwt.decode(token, signing_key, algorithms=["RS256", "ES256"], audience=audience, issuer=issuer, options=options)
         return jwt.decode(token, hs256_secret, algorithms=["HS256"], audience=audience, issuer=issuer, options=options)
-    else:
-        raise ValueError("No validation method configured (jwks_url or hs256_secret required)")
+    except jwt.PyJWTError as e:
+        raise JWTError(str(e)) from e
 
 
 def now_ts() -> int:
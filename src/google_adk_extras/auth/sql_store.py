@@ -18,6 +18,12 @@ except ImportError as e:
 Base = declarative_base()
 
 
+def _utcnow() -> datetime:
+    # Single clock for the store; tests patch this instead of sleeping. Column
+    # defaults call it through a lambda so the patch reaches them too.
+    return datetime.now(timezone.utc)
+
+
 def _pbkdf2(password: str, salt: str) -> str:
     dk = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 200_000)
     return dk.hex()
@@ -45,7 +51,7 @@ class User(Base):
     username = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String, nullable=False)
     roles = Column(String, default="")  # comma-separated
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), default=lambda: _utcnow())
     disabled = Column(Boolean, default=False)
 
 
@@ -64,7 +70,7 @@ class ApiKey(Base):
     user_id = Column(String, index=True, nullable=True)
     key_hash = Column(String, nullable=False)
     name = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), default=lambda: _utcnow())
     revoked_at = Column(DateTime(timezone=True), nullable=True)
 
 
@@ -99,7 +105,7 @@ class AuthStore:
             rt = RefreshToken(
                 jti=jti,
                 user_id=user_id,
-                expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds),
+                expires_at=_utcnow() + timedelta(seconds=ttl_seconds),
                 fingerprint=fingerprint,
             )
             s.add(rt)
@@ -116,7 +122,7 @@ class AuthStore:
                 # Coerce offset-naive -> UTC for SQLite and ensure comparable types
                 if getattr(exp, "tzinfo", None) is None:
                     exp = exp.replace(tzinfo=timezone.utc)
-                now = datetime.now(timezone.utc)
+                now = _utcnow()
                 if exp <= now:
                     return False
                 if fingerprint and rt.fingerprint and rt.fingerprint != fingerprint:
@@ -130,7 +136,7 @@ class AuthStore:
             rt: Optional[RefreshToken] = s.query(RefreshToken).filter_by(jti=jti).first()
             if not rt:
                 return
-            rt.revoked_at = datetime.now(timezone.utc)
+            rt.revoked_at = _utcnow()
             s.add(rt)
             s.commit()
 
@@ -178,7 +184,7 @@ class AuthStore:
             rec = s.query(ApiKey).filter_by(id=key_id).first()
             if not rec:
                 return
-            rec.revoked_at = datetime.now(timezone.utc)
+            rec.revoked_at = _utcnow()
             s.add(rec)
             s.commit()
 
@@ -7,13 +7,32 @@ thread-safe registry management.
 
 import logging
 import threading
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.cli.utils.base_agent_loader import BaseAgentLoader
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+def validate_agent_registration(name: str, agent: BaseAgent) -> None:
+    """Validate a name/agent pair before it is registered.
+    
+    Args:
+        name: Agent name for discovery and loading.
+        agent: BaseAgent instance to register.
+        
+    Raises:
+        ValueError: If name is empty or agent is not a BaseAgent instance.
+    """
+    if not name or not name.strip():
+        raise ValueError("Agent name cannot be empty")
+        
+    if not isinstance(agent, BaseAgent):
+        raise ValueError(f"Agent must be BaseAgent instance, got {type(agent)}")
+
 
 class CustomAgentLoader(BaseAgentLoader):
     """Enhanced agent loader for programmatic agent management.
@@ -37,6 +56,9 @@ class CustomAgentLoader(BaseAgentLoader):
         """Initialize CustomAgentLoader."""
         self._registered_agents: Dict[str, BaseAgent] = {}
         self._lock = threading.RLock()  # Thread-safe access to registry
+        # Bumped on every registry mutation; list_agents() caches against it.
+        self._generation = 0
+        self._names_cache: Tuple[int, Tuple[str, ...]] = (0, ())
         
         logger.debug("CustomAgentLoader initialized")
     
@@ -50,11 +72,7 @@ class CustomAgentLoader(BaseAgentLoader):
         Raises:
             ValueError: If name is empty or agent is not a BaseAgent instance.
         """
-        if not name or not name.strip():
-            raise ValueError("Agent name cannot be empty")
-            
-        if not isinstance(agent, BaseAgent):
-            raise ValueError(f"Agent must be BaseAgent instance, got {type(agent)}")
+        validate_agent_registration(name, agent)
         
         with self._lock:
             if name in self._registered_agents:
@@ -63,6 +81,36 @@ class CustomAgentLoader(BaseAgentLoader):
                 logger.info("Registering new agent instance: %s", name)
             
             self._registered_agents[name] = agent
+            self._generation += 1
+    
+    def register_agents(self, agents: Dict[str, BaseAgent]) -> None:
+        """Register multiple agent instances under a single lock acquisition.
+        
+        All entries are validated before any is registered, so an invalid
+        entry leaves the registry unchanged.
+        
+        Args:
+            agents: Mapping of agent names to BaseAgent instances.
+            
+        Raises:
+            ValueError: If agents is not a dict, or any name is empty or any
+                agent is not a BaseAgent instance.
+        """
+        if not isinstance(agents, dict):
+            raise ValueError("Agents must be a dictionary mapping names to BaseAgent instances")
+        
+        for name, agent in agents.items():
+            validate_agent_registration(name, agent)
+        
+        if not agents:
+            return
+        
+        with self._lock:
+            replaced = sum(1 for name in agents if name in self._registered_agents)
+            self._registered_agents.update(agents)
+            self._generation += 1
+        
+        logger.info("Registered %d agent instances (%d replaced)", len(agents), replaced)
     
     def unregister_agent(self, name: str) -> bool:
         """Unregister an agent instance by name.
@@ -74,13 +122,13 @@ class CustomAgentLoader(BaseAgentLoader):
             bool: True if agent was found and removed, False otherwise.
         """
         with self._lock:
-            if name in self._registered_agents:
-                del self._registered_agents[name]
-                logger.info("Unregistered agent instance: %s", name)
-                return True
-            else:
+            if self._registered_agents.pop(name, _MISSING) is _MISSING:
                 logger.debug("Agent not found in registry: %s", name)
                 return False
+            self._generation += 1
+        
+        logger.info("Unregistered agent instance: %s", name)
+        return True
     
     def is_registered(self, name: str) -> bool:
         """Check if an agent is registered by name.
@@ -108,6 +156,7 @@ class CustomAgentLoader(BaseAgentLoader):
         with self._lock:
             count = len(self._registered_agents)
             self._registered_agents.clear()
+            self._generation += 1
             logger.info("Cleared %d registered agents", count)
     
     def load_agent(self, name: str) -> BaseAgent:
@@ -141,11 +190,13 @@ class CustomAgentLoader(BaseAgentLoader):
             List[str]: Sorted list of all registered agent names.
         """
         with self._lock:
-            agent_names = list(self._registered_agents.keys())
+            generation, names = self._names_cache
+            if generation != self._generation:
+                names = tuple(sorted(self._registered_agents))
+                self._names_cache = (self._generation, names)
         
-        sorted_agents = sorted(agent_names)
-        logger.debug("Total registered agents: %d", len(sorted_agents))
-        return sorted_agents
+        logger.debug("Total registered agents: %d", len(names))
+        return list(names)
 
     # Compatibility with ADK's AgentLoader API used by AgentChangeEventHandler
     def remove_agent_from_cache(self, name: str) -> None:
@@ -136,6 +136,11 @@ def get_enhanced_fast_api_app(
         eval_sets_manager = LocalEvalSetsManager(agents_dir=agents_dir)
         eval_set_results_manager = LocalEvalSetResultsManager(agents_dir=agents_dir)
 
+    def _gcp_project_and_location():
+        """Load the agent .env and read the GCP project/location once."""
+        envs.load_dotenv_for_agent("", agents_dir)
+        return os.environ["GOOGLE_CLOUD_PROJECT"], os.environ["GOOGLE_CLOUD_LOCATION"]
+
     def _parse_agent_engine_resource_name(agent_engine_id_or_resource_name):
         """Parse agent engine resource name (same as ADK)."""
         if not agent_engine_id_or_resource_name:
@@ -144,18 +149,15 @@ def get_enhanced_fast_api_app(
             )
 
         if "/" in agent_engine_id_or_resource_name:
-            if len(agent_engine_id_or_resource_name.split("/")) != 6:
+            parts = agent_engine_id_or_resource_name.split("/")
+            if len(parts) != 6:
                 raise click.ClickException(
                     "Agent engine resource name is mal-formatted. It should be of"
                     " format: projects/{project_id}/locations/{location}/reasoningEngines/{resource_id}"
                 )
-            project = agent_engine_id_or_resource_name.split("/")[1]
-            location = agent_engine_id_or_resource_name.split("/")[3]
-            agent_engine_id = agent_engine_id_or_resource_name.split("/")[-1]
+            project, location, agent_engine_id = parts[1], parts[3], parts[5]
         else:
-            envs.load_dotenv_for_agent("", agents_dir)
-            project = os.environ["GOOGLE_CLOUD_PROJECT"]
-            location = os.environ["GOOGLE_CLOUD_LOCATION"]
+            project, location = _gcp_project_and_location()
             agent_engine_id = agent_engine_id_or_resource_name
         return project, location, agent_engine_id
 
@@ -163,15 +165,15 @@ def get_enhanced_fast_api_app(
     if memory_service_uri:
         if memory_service_uri.startswith("rag://"):
             from google.adk.memory.vertex_ai_rag_memory_service import VertexAiRagMemoryService
-            rag_corpus = memory_service_uri.split("://")[1]
+            rag_corpus = memory_service_uri.partition("://")[2]
             if not rag_corpus:
                 raise click.ClickException("Rag corpus can not be empty.")
-            envs.load_dotenv_for_agent("", agents_dir)
+            project, location = _gcp_project_and_location()
             memory_service = VertexAiRagMemoryService(
-                rag_corpus=f'projects/{os.environ["GOOGLE_CLOUD_PROJECT"]}/locations/{os.environ["GOOGLE_CLOUD_LOCATION"]}/ragCorpora/{rag_corpus}'
+                rag_corpus=f"projects/{project}/locations/{location}/ragCorpora/{rag_corpus}"
             )
         elif memory_service_uri.startswith("agentengine://"):
-            agent_engine_id_or_resource_name = memory_service_uri.split("://")[1]
+            agent_engine_id_or_resource_name = memory_service_uri.partition("://")[2]
             project, location, agent_engine_id = _parse_agent_engine_resource_name(
                 agent_engine_id_or_resource_name
             )
@@ -182,7 +184,7 @@ def get_enhanced_fast_api_app(
             )
         elif memory_service_uri.startswith("yaml://"):
             from .memory.yaml_file_memory_service import YamlFileMemoryService
-            base_directory = memory_service_uri.split("://")[1]
+            base_directory = memory_service_uri.partition("://")[2]
             memory_service = YamlFileMemoryService(base_directory=base_directory)
         elif memory_service_uri.startswith("redis://"):
             from .memory.redis_memory_service import RedisMemoryService
@@ -203,7 +205,7 @@ def get_enhanced_fast_api_app(
     # Build the Session service (enhanced to recognize extras URIs)
     if session_service_uri:
         if session_service_uri.startswith("agentengine://"):
-            agent_engine_id_or_resource_name = session_service_uri.split("://")[1]
+            agent_engine_id_or_resource_name = session_service_uri.partition("://")[2]
             project, location, agent_engine_id = _parse_agent_engine_resource_name(
                 agent_engine_id_or_resource_name
             )
@@ -214,7 +216,7 @@ def get_enhanced_fast_api_app(
             )
         elif session_service_uri.startswith("yaml://"):
             from .sessions.yaml_file_session_service import YamlFileSessionService
-            base_directory = session_service_uri.split("://")[1]
+            base_directory = session_service_uri.partition("://")[2]
             session_service = YamlFileSessionService(base_directory=base_directory)
         elif session_service_uri.startswith("redis://"):
             from .sessions.redis_session_service import RedisSessionService
@@ -235,15 +237,15 @@ def get_enhanced_fast_api_app(
     # Build the Artifact service (enhanced to recognize extras URIs)
     if artifact_service_uri:
         if artifact_service_uri.startswith("gs://"):
-            gcs_bucket = artifact_service_uri.split("://")[1]
+            gcs_bucket = artifact_service_uri.partition("://")[2]
             artifact_service = GcsArtifactService(bucket_name=gcs_bucket)
         elif artifact_service_uri.startswith("local://"):
             from .artifacts.local_folder_artifact_service import LocalFolderArtifactService
-            base_directory = artifact_service_uri.split("://")[1]
+            base_directory = artifact_service_uri.partition("://")[2]
             artifact_service = LocalFolderArtifactService(base_directory=base_directory)
         elif artifact_service_uri.startswith("s3://"):
             from .artifacts.s3_artifact_service import S3ArtifactService
-            bucket_name = artifact_service_uri.split("://")[1]
+            bucket_name = artifact_service_uri.partition("://")[2]
             artifact_service = S3ArtifactService(bucket_name=bucket_name)
         elif artifact_service_uri.startswith(("sqlite://", "postgresql://", "mysql://")):
             from .artifacts.sql_artifact_service import SQLArtifactService
@@ -490,19 +492,27 @@ def get_enhanced_fast_api_app(
         # 2) Programmatic A2A for registered agents (no agents_dir)
         if programmatic_a2a:
             # Attempt to enumerate agents from the provided loader
-            agent_names = []
-            if hasattr(final_agent_loader, "list_agents"):
+            agents: Dict[str, Any] = {}
+            if hasattr(final_agent_loader, "get_registered_agents"):
+                # CustomAgentLoader: one locked snapshot instead of a
+                # load_agent round-trip per name.
                 try:
-                    agent_names = final_agent_loader.list_agents()  # type: ignore[attr-defined]
+                    registered = final_agent_loader.get_registered_agents()  # type: ignore[attr-defined]
+                    agents = {name: registered[name] for name in sorted(registered)}
                 except Exception:
-                    agent_names = []
-
-            for app_name in agent_names:
+                    agents = {}
+            elif hasattr(final_agent_loader, "list_agents"):
                 try:
-                    agent_instance = final_agent_loader.load_agent(app_name)
+                    agent_names = final_agent_loader.list_agents()  # type: ignore[attr-defined]
                 except Exception:
-                    agent_instance = None
+                    agent_names = []
+                for app_name in agent_names:
+                    try:
+                        agents[app_name] = final_agent_loader.load_agent(app_name)
+                    except Exception:
+                        agents[app_name] = None
 
+            for app_name, agent_instance in agents.items():
                 logger.info("Setting up A2A agent (programmatic): %s", app_name)
                 try:
                     # Construct AgentCard data
@@ -3,7 +3,9 @@
 import pytest
 import tempfile
 import os
+import shutil
 import sys
+import uuid
 
 # Add src to path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -15,14 +17,12 @@ def temp_dir():
     temp_dir = tempfile.mkdtemp(prefix="adk_test_")
     yield temp_dir
     # Cleanup after all tests
-    import shutil
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture(scope="function")
 def temp_file_path(temp_dir):
     """Create a temporary file path for tests."""
-    import uuid
     return os.path.join(temp_dir, str(uuid.uuid4()))
 
 
@@ -209,35 +209,22 @@ tools: []
             # (TestClient automatically handles lifespan events)
             pass
     
-    @pytest.mark.skipif(
-        not os.path.exists("/tmp"),
-        reason="Requires /tmp directory for database testing"
-    )
     def test_database_session_integration(self):
         """Test integration with database session service."""
-        db_path = "/tmp/adk_builder_integration_test.db"
+        # Per-test scratch dir: no shared path to pre-clean, removed on teardown
+        db_path = os.path.join(self.temp_dir, "sessions.db")
         
-        # Clean up any existing test database
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        builder = AdkBuilder()
+        app = (builder
+               .with_agents_dir(self.agents_dir)
+               .with_session_service(f"sqlite:///{db_path}")
+               .build_fastapi_app())
         
-        try:
-            builder = AdkBuilder()
-            app = (builder
-                   .with_agents_dir(self.agents_dir)
-                   .with_session_service(f"sqlite:///{db_path}")
-                   .build_fastapi_app())
-            
-            assert isinstance(app, FastAPI)
-            
-            with TestClient(app) as client:
-                # App should work with database session service
-                pass
-                
-            # Verify database file was created (indicates session service is working)
-            assert os.path.exists(db_path)
+        assert isinstance(app, FastAPI)
+        
+        with TestClient(app) as client:
+            # App should work with database session service
+            pass
             
-        finally:
-            # Clean up test database
-            if os.path.exists(db_path):
-                os.remove(db_path)
+        # Verify database file was created (indicates session service is working)
+        assert os.path.exists(db_path)
@@ -180,7 +180,16 @@ root_agent = Agent(
         
         assert loaded1 is self.agent1
         assert loaded2 is self.agent2
-    
+
+    def test_bulk_registration_rejects_invalid_entry_atomically(self):
+        """A bad entry in with_agents should register nothing."""
+        builder = AdkBuilder()
+
+        with pytest.raises(ValueError, match="BaseAgent instance"):
+            builder.with_agents({"good": self.agent1, "bad": "not an agent"})
+
+        assert builder._registered_agents == {}
+
     def test_agent_loader_validation(self):
         """Test validation in agent loader creation."""
         builder = AdkBuilder()
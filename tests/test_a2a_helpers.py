@@ -174,6 +174,37 @@ def test_programmatic_a2a_mounts_routes(tmp_path, monkeypatch):
     assert any(p == "/a2a/a2" for p in paths)
 
 
+def test_programmatic_a2a_uses_registry_snapshot(tmp_path, monkeypatch):
+    _install_adk_a2a_stubs()
+
+    # Registry-style loader (like CustomAgentLoader): one snapshot, no per-name loads
+    class RegistryLoader:
+        def get_registered_agents(self):
+            return {"b2": object(), "b1": object()}
+
+        def list_agents(self):
+            raise AssertionError("list_agents should not be needed")
+
+        def load_agent(self, name: str):
+            raise AssertionError("load_agent should not be called per agent")
+
+    from google_adk_extras.enhanced_fastapi import get_enhanced_fast_api_app
+
+    loader = RegistryLoader()
+
+    app = get_enhanced_fast_api_app(
+        agent_loader=loader,
+        agents_dir=None,
+        a2a=True,
+        programmatic_a2a=True,
+        programmatic_a2a_mount_base="/a2a",
+    )
+
+    paths = [getattr(r, "path", None) for r in app.router.routes]
+    assert "/a2a/b1" in paths
+    assert "/a2a/b2" in paths
+
+
 def test_with_remote_a2a_agent_registers(monkeypatch):
     # Install RemoteA2aAgent stub under an expected path
     class RemoteA2aAgent:
@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("jwt")
+
+from google_adk_extras.auth import jwt_utils
+
+
+def test_jwk_client_reused_per_jwks_url(monkeypatch):
+    created = []
+
+    class _FakeKey:
+        key = "secret"
+
+    class _FakeClient:
+        def __init__(self, url):
+            created.append(url)
+
+        def get_signing_key_from_jwt(self, token):
+            return _FakeKey()
+
+    jwt_mod, _ = jwt_utils._import_pyjwt()
+    monkeypatch.setattr(jwt_utils, "_import_pyjwt", lambda: (jwt_mod, _FakeClient))
+    monkeypatch.setattr(jwt_mod, "decode", lambda *a, **kw: {"sub": "u"})
+    jwt_utils._jwk_client.cache_clear()
+    try:
+        for _ in range(3):
+            assert jwt_utils.decode_jwt("t", jwks_url="https://a/jwks") == {"sub": "u"}
+        jwt_utils.decode_jwt("t", jwks_url="https://b/jwks")
+    finally:
+        jwt_utils._jwk_client.cache_clear()
+
+    assert created == ["https://a/jwks", "https://b/jwks"]
+
+
+def test_decode_errors_raised_as_jwt_error(monkeypatch):
+    with pytest.raises(jwt_utils.JWTError):
+        jwt_utils.decode_jwt("not-a-token", hs256_secret="s")
+
+    def _missing():
+        raise ImportError("PyJWT is required")
+
+    monkeypatch.setattr(jwt_utils, "_import_pyjwt", _missing)
+    with pytest.raises(jwt_utils.JWTError, match="PyJWT is required"):
+        jwt_utils.decode_jwt("t", hs256_secret="s")
@@ -2,18 +2,19 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from google_adk_extras.auth import sql_store
 from google_adk_extras.auth.sql_store import AuthStore
 
 
 class TestSqlAuthStore:
-    def test_refresh_verify_and_expiry(self):
+    def test_refresh_verify_and_expiry(self, monkeypatch):
         store = AuthStore("sqlite:///:memory:")
         uid = store.create_user("charlie", "chocolate")
         jti = store.issue_refresh(uid, ttl_seconds=1)
         assert store.verify_refresh(jti, uid) is True
-        # After expiry
-        import time
-        time.sleep(1.1)
+        # After expiry: advance the store clock instead of sleeping
+        later = datetime.now(timezone.utc) + timedelta(seconds=2)
+        monkeypatch.setattr(sql_store, "_utcnow", lambda: later)
         assert store.verify_refresh(jti, uid) is False
 
     def test_api_key_flow(self):
@@ -23,3 +24,10 @@ class TestSqlAuthStore:
         store.revoke_api_key(kid)
         assert store.verify_api_key(key) is False
 
+    def test_created_at_default_uses_store_clock(self, monkeypatch):
+        fixed = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        monkeypatch.setattr(sql_store, "_utcnow", lambda: fixed)
+        store = AuthStore("sqlite:///:memory:")
+        store.create_api_key(user_id="u1", name="dev")
+        [row] = store.list_api_keys()
+        assert row["created_at"].startswith("2020-01-01T00:00:00")
@@ -28,6 +28,14 @@ class TestAdkBuilder:
         assert result is builder  # Should return self for chaining
         assert builder._agents_dir == "/test/agents"
     
+    def test_agents_dir_normalized_once(self, monkeypatch, tmp_path):
+        """Test relative and ~ paths are made absolute when configured."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        
+        assert AdkBuilder().with_agents_dir("agents")._agents_dir == str(tmp_path / "agents")
+        assert AdkBuilder().with_agents_dir("~/agents/")._agents_dir == str(tmp_path / "home" / "agents")
+    
     def test_fluent_interface_chaining(self):
         """Test that fluent interface allows method chaining."""
         builder = (AdkBuilder()
@@ -235,6 +243,63 @@ class TestAdkBuilderServiceCreation:
             
             mock_service.assert_called_once_with(base_directory="/path/to/sessions.yaml")
     
+    def test_in_memory_defaults_fresh_per_call(self):
+        """Test fallback in-memory services are not shared by default."""
+        builder = AdkBuilder()
+        
+        assert builder._create_session_service() is not builder._create_session_service()
+        assert builder._create_artifact_service() is not builder._create_artifact_service()
+        assert builder._create_memory_service() is not builder._create_memory_service()
+    
+    def test_shared_in_memory_services_opt_in(self):
+        """Test with_shared_in_memory_services reuses fallbacks per builder."""
+        builder = AdkBuilder().with_shared_in_memory_services()
+        
+        assert builder._create_session_service() is builder._create_session_service()
+        assert builder._create_artifact_service() is builder._create_artifact_service()
+        assert builder._create_memory_service() is builder._create_memory_service()
+        # Not shared across builders
+        other = AdkBuilder().with_shared_in_memory_services()
+        assert other._create_session_service() is not builder._create_session_service()
+    
+    def test_uri_services_cached_until_uri_changes(self, tmp_path):
+        """Test URI-built services are reused until the URI is reconfigured."""
+        builder = AdkBuilder().with_session_service(f"yaml://{tmp_path}/a")
+        
+        with patch('google_adk_extras.sessions.yaml_file_session_service.YamlFileSessionService') as mock_service:
+            first = builder._create_session_service()
+            assert builder._create_session_service() is first
+            mock_service.assert_called_once_with(base_directory=f"{tmp_path}/a")
+            
+            builder.with_session_service(f"yaml://{tmp_path}/b")
+            builder._create_session_service()
+            assert mock_service.call_count == 2
+            mock_service.assert_called_with(base_directory=f"{tmp_path}/b")
+    
+    @patch('google_adk_extras.enhanced_fastapi.get_enhanced_fast_api_app')
+    def test_runners_share_cached_services_app_gets_uris(self, mock_enhanced_app, tmp_path):
+        """Test runners share URI-built services; the app is built from URIs."""
+        from google.adk.agents import Agent
+        
+        builder = (AdkBuilder()
+                  .with_agent_instance("a", Agent(name="a", model="gemini-2.0-flash"))
+                  .with_artifact_service(f"local://{tmp_path}"))
+        builder.build_fastapi_app()
+        # Validation-only construction for the app is not cached
+        assert builder._service_cache == {}
+        first = builder.build_runner("a")
+        second = builder.build_runner("a")
+        
+        assert first.artifact_service is second.artifact_service
+        assert first.session_service is not second.session_service
+        assert first.memory_service is not second.memory_service
+        
+        call_kwargs = mock_enhanced_app.call_args[1]
+        assert call_kwargs['artifact_service_uri'] == f"local://{tmp_path}"
+        assert 'session_service' not in call_kwargs
+        assert 'artifact_service' not in call_kwargs
+        assert 'memory_service' not in call_kwargs
+    
     def test_create_artifact_service_default(self):
         """Test default artifact service creation."""
         builder = AdkBuilder()
@@ -266,3 +331,17 @@ class TestAdkBuilderServiceCreation:
             service = builder._create_memory_service()
             
             mock_service.assert_called_once_with(base_directory="/path/to/memory.yaml")
+    
+    def test_create_services_reject_unsupported_uris(self):
+        """Test unknown schemes and scheme-less URIs are rejected."""
+        builder = (AdkBuilder()
+                  .with_session_service("yaml")
+                  .with_artifact_service("ftp://bucket")
+                  .with_memory_service("postgresql+asyncpg://db"))
+        
+        with pytest.raises(ValueError, match="Unsupported session service URI"):
+            builder._create_session_service()
+        with pytest.raises(ValueError, match="Unsupported artifact service URI"):
+            builder._create_artifact_service()
+        with pytest.raises(ValueError, match="Unsupported memory service URI"):
+            builder._create_memory_service()
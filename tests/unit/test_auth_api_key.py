@@ -24,3 +24,6 @@ def test_list_apps_requires_basic():
     # Authorized
     r = client.get("/list-apps", headers={"Authorization": "Basic YTpi"})
     assert r.status_code == 200
+    # Wrong password (a:c)
+    r = client.get("/list-apps", headers={"Authorization": "Basic YTpj"})
+    assert r.status_code == 401
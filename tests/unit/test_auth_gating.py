@@ -69,3 +69,20 @@ def test_basic_only():
     # JWT denied
     assert c.get("/list-apps", headers={"Authorization": "Bearer t"}).status_code == 401
 
+
+def test_jwt_without_subject_rejected():
+    secret = "s"
+    cfg = AuthConfig(
+        enabled=True,
+        jwt_validator=JwtValidatorConfig(issuer="iss", audience="aud", hs256_secret=secret),
+        allow_bearer_jwt=True,
+    )
+    app = get_enhanced_fast_api_app(agent_loader=CustomAgentLoader(), web=False, auth_config=cfg)
+    c = TestClient(app)
+    now = now_ts()
+    token = encode_jwt({"iss": "iss", "aud": "aud", "iat": now, "nbf": now, "exp": now + 600}, algorithm="HS256", key=secret)
+    r = c.get("/list-apps", headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 401
+    assert r.json()["detail"] == "Invalid token: no subject"
+    # Malformed token → 401
+    assert c.get("/list-apps", headers={"Authorization": "Bearer not-a-jwt"}).status_code == 401
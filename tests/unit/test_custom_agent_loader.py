@@ -69,6 +69,33 @@ class TestCustomAgentLoader:
         assert loader.get_registered_agents()["test_agent"] is self.mock_agent2
         assert len(loader.get_registered_agents()) == 1
 
+    def test_register_agents_bulk(self):
+        """Test registering several agents in one call."""
+        loader = CustomAgentLoader()
+        loader.register_agent("agent1", self.mock_agent1)
+        
+        loader.register_agents({"agent1": self.mock_agent2, "agent2": self.mock_agent1})
+        
+        registered = loader.get_registered_agents()
+        assert registered["agent1"] is self.mock_agent2
+        assert registered["agent2"] is self.mock_agent1
+        assert loader.list_agents() == ["agent1", "agent2"]
+
+    def test_register_agents_validation_is_atomic(self):
+        """Test that an invalid entry registers nothing."""
+        loader = CustomAgentLoader()
+        
+        with pytest.raises(ValueError, match="Agent name cannot be empty"):
+            loader.register_agents({"agent1": self.mock_agent1, " ": self.mock_agent2})
+        
+        with pytest.raises(ValueError, match="Agent must be BaseAgent instance"):
+            loader.register_agents({"agent1": self.mock_agent1, "bad": "not an agent"})
+        
+        with pytest.raises(ValueError, match="dictionary"):
+            loader.register_agents([("agent1", self.mock_agent1)])
+        
+        assert loader.get_registered_agents() == {}
+
     def test_unregister_agent(self):
         """Test agent unregistration."""
         loader = CustomAgentLoader()
@@ -147,6 +174,27 @@ class TestCustomAgentLoader:
         
         assert agents == []
 
+    def test_list_agents_tracks_mutations(self):
+        """Test cached agent names are refreshed after each mutation."""
+        loader = CustomAgentLoader()
+        loader.register_agent("b_agent", self.mock_agent1)
+        
+        names = loader.list_agents()
+        assert names == ["b_agent"]
+        
+        # Mutating the returned list must not affect the cached names
+        names.append("bogus")
+        assert loader.list_agents() == ["b_agent"]
+        
+        loader.register_agent("a_agent", self.mock_agent2)
+        assert loader.list_agents() == ["a_agent", "b_agent"]
+        
+        loader.unregister_agent("b_agent")
+        assert loader.list_agents() == ["a_agent"]
+        
+        loader.clear_registry()
+        assert loader.list_agents() == []
+
     def test_get_registered_agents_copy(self):
         """Test that get_registered_agents returns a copy."""
         loader = CustomAgentLoader()
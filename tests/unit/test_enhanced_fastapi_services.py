@@ -112,3 +112,29 @@ def test_memory_sqlite_uses_sql_memory_service(mock_server):
         from google_adk_extras.memory.sql_memory_service import SQLMemoryService
 
         assert isinstance(mem_service, SQLMemoryService)
+
+
+@patch("google_adk_extras.enhanced_fastapi.EnhancedAdkWebServer")
+@patch("google_adk_extras.enhanced_fastapi.VertexAiSessionService")
+def test_session_agentengine_uri_parsing(mock_vertex, mock_server, monkeypatch):
+    """agentengine:// accepts a full resource name or a bare id plus env vars."""
+    mock_server_instance = MagicMock()
+    mock_server_instance.get_fast_api_app.return_value = MagicMock()
+    mock_server.return_value = mock_server_instance
+
+    with tempfile.TemporaryDirectory() as tmp:
+        get_enhanced_fast_api_app(
+            agents_dir=tmp,
+            session_service_uri="agentengine://projects/p1/locations/us-central1/reasoningEngines/123",
+            web=False,
+        )
+        mock_vertex.assert_called_with(project="p1", location="us-central1", agent_engine_id="123")
+
+        monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "p2")
+        monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "europe-west1")
+        get_enhanced_fast_api_app(
+            agents_dir=tmp,
+            session_service_uri="agentengine://456",
+            web=False,
+        )
+        mock_vertex.assert_called_with(project="p2", location="europe-west1", agent_engine_id="456")